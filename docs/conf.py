@@ -12,8 +12,9 @@
 
 
 import os
-import subprocess
 import sys
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as get_package_version
 from pathlib import Path
 
 from packaging.version import Version
@@ -34,7 +35,12 @@ author = "DataOps.ETL"
 #
 # The short X.Y version.
 
-ver = Version(subprocess.check_output("python ../setup.py --version", shell=True, text=True).strip())
+try:
+    ver = Version(get_package_version("onetl"))
+except PackageNotFoundError:
+    # package is not installed into docs environment, read version from sources
+    ver = Version((PROJECT_ROOT_DIR / "onetl" / "VERSION").read_text().strip())
+
 version = ver.base_version
 # The full version, including alpha/beta/rc tags.
 release = ver.public
@@ -84,9 +90,11 @@ towncrier_draft_working_directory = PROJECT_ROOT_DIR
 github_username = "MobileTeleSystems"
 github_repository = "onetl"
 
+# do not embed package version into prolog, otherwise every version bump invalidates all cached doctrees
+docs_version = os.getenv("READTHEDOCS_VERSION", "stable")
 rst_prolog = f"""
 .. |support_hooks| image:: https://img.shields.io/badge/%20-support%20hooks-blue
-    :target: https://onetl.readthedocs.io/en/{ver}/hooks/index.html
+    :target: https://onetl.readthedocs.io/en/{docs_version}/hooks/index.html
 """
 
 # Add any paths that contain templates here, relative to this directory.
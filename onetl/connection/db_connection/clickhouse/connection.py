@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import ClassVar, Optional
+from typing import Callable, ClassVar, Optional
 
 from etl_entities.instance import Host
 
@@ -19,6 +19,7 @@ from onetl.connection.db_connection.clickhouse.options import (
 )
 from onetl.connection.db_connection.jdbc_connection import JDBCConnection
 from onetl.connection.db_connection.jdbc_mixin import JDBCStatementType
+from onetl.connection.db_connection.jdbc_mixin.connection import T
 from onetl.hooks import slot, support_hooks
 from onetl.impl import GenericOptions
 
@@ -199,12 +200,13 @@ class Clickhouse(JDBCConnection):
     def __str__(self):
         return f"{self.__class__.__name__}[{self.host}:{self.port}]"
 
-    @staticmethod
-    def _build_statement(
+    def _execute_on_driver(
+        self,
         statement: str,
         statement_type: JDBCStatementType,
-        jdbc_connection,
-        statement_args,
-    ):
+        callback: Callable[..., T],
+        options: ClickhouseFetchOptions | ClickhouseExecuteOptions,
+        read_only: bool,
+    ) -> T:
         # Clickhouse does not support prepared statements, as well as calling functions/procedures
-        return jdbc_connection.createStatement(*statement_args)
+        return super()._execute_on_driver(statement, JDBCStatementType.GENERIC, callback, options, read_only)
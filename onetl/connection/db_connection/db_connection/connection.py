@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 try:
     from pydantic.v1 import Field, validator
@@ -27,6 +27,8 @@ class DBConnection(BaseDBConnection, FrozenModel):
 
     Dialect = DBDialect
 
+    _log_exclude_fields: ClassVar[frozenset[str]] = frozenset({"spark"})
+
     @classmethod
     def _forward_refs(cls) -> dict[str, type]:
         try_import_pyspark()
@@ -54,6 +56,6 @@ class DBConnection(BaseDBConnection, FrozenModel):
 
     def _log_parameters(self):
         log.info("|%s| Using connection parameters:", self.__class__.__name__)
-        parameters = self.dict(exclude_none=True, exclude={"spark"})
+        parameters = self.dict(exclude_none=True, exclude=self._log_exclude_fields)
         for attr, value in parameters.items():
             log_with_indent(log, "%s = %r", attr, value)
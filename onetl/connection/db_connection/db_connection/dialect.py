@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import os
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 from onetl.base import BaseDBDialect
 from onetl.hwm import Edge, Window
@@ -14,6 +15,15 @@ if TYPE_CHECKING:
     from etl_entities.hwm import HWM
     from pyspark.sql.types import StructField
 
+_edge_operators: Mapping[tuple[str, bool], str] = MappingProxyType(
+    {
+        ("start", True): ">=",
+        ("start", False): "> ",
+        ("end", True): "<=",
+        ("end", False): "< ",
+    },
+)
+
 
 class DBDialect(BaseDBDialect):
     def detect_hwm_class(self, field: StructField) -> type[HWM] | None:
@@ -51,22 +61,22 @@ class DBDialect(BaseDBDialect):
             # LIMIT 0 not valid in some databases
             where = ["1 = 0"]
 
-        where_clauses = []
+        query_parts = [
+            f"SELECT{hint}{columns_str}",
+            f"FROM{indent}{table}",
+        ]
+
         if len(where) == 1:
-            where_clauses.append("WHERE" + indent + where[0])
+            query_parts.append("WHERE" + indent + where[0])
         else:
             for i, item in enumerate(where):
                 directive = "WHERE" if i == 0 else "  AND"
-                where_clauses.append(directive + indent + f"({item})")
+                query_parts.append(directive + indent + f"({item})")
 
-        query_parts = [
-            f"SELECT{hint}{columns_str}",
-            f"FROM{indent}{table}",
-            *where_clauses,
-            f"LIMIT{indent}{limit}" if limit else "",
-        ]
+        if limit:
+            query_parts.append(f"LIMIT{indent}{limit}")
 
-        return os.linesep.join(filter(None, query_parts)).strip()
+        return os.linesep.join(query_parts).strip()
 
     def apply_window(
         self,
@@ -109,14 +119,7 @@ class DBDialect(BaseDBDialect):
         if not edge.is_set():
             return None
 
-        operators: dict[tuple[str, bool], str] = {
-            ("start", True): ">=",
-            ("start", False): "> ",
-            ("end", True): "<=",
-            ("end", False): "< ",
-        }
-
-        operator = operators[(position, edge.including)]
+        operator = _edge_operators[(position, edge.including)]
         value = self._serialize_value(edge.value)
         return f"{expression} {operator} {value}"
 
@@ -137,12 +140,10 @@ class DBDialect(BaseDBDialect):
         """
         Transform the datetime value into supported by SQL Dialect
         """
-        result = value.isoformat()
-        return repr(result)
+        return f"'{value.isoformat()}'"
 
     def _serialize_date(self, value: date) -> str:
         """
         Transform the date value into supported by SQL Dialect
         """
-        result = value.isoformat()
-        return repr(result)
+        return f"'{value.isoformat()}'"
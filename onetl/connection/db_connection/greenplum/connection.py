@@ -383,19 +383,20 @@ class Greenplum(JDBCMixin, DBConnection):
         log.info("|%s| Getting min and max values for %r ...", self.__class__.__name__, window.expression)
         jdbc_options = self.ReadOptions.parse(options).copy(update={"fetchsize": 1})
 
-        query = self.dialect.get_sql_query(
+        dialect = self.dialect
+        query = dialect.get_sql_query(
             table=source,
             columns=[
-                self.dialect.aliased(
-                    self.dialect.get_min_value(window.expression),
-                    self.dialect.escape_column("min"),
+                dialect.aliased(
+                    dialect.get_min_value(window.expression),
+                    dialect.escape_column("min"),
                 ),
-                self.dialect.aliased(
-                    self.dialect.get_max_value(window.expression),
-                    self.dialect.escape_column("max"),
+                dialect.aliased(
+                    dialect.get_max_value(window.expression),
+                    dialect.escape_column("max"),
                 ),
             ],
-            where=self.dialect.apply_window(where, window),
+            where=dialect.apply_window(where, window),
         )
 
         log.info("|%s| Executing SQL query (on driver):", self.__class__.__name__)
@@ -476,7 +477,7 @@ class Greenplum(JDBCMixin, DBConnection):
         log.debug("|%s| Executing SQL query (on driver):")
         log_lines(log, query, level=logging.DEBUG)
 
-        df = self._query_on_driver(query, self.FetchOptions())
+        df = self._query_on_driver(query, self.FetchOptions.parse(None))
         result = df.collect()
 
         log.debug(
@@ -497,7 +498,7 @@ class Greenplum(JDBCMixin, DBConnection):
         log.debug("|%s| Executing SQL query (on driver):")
         log_lines(log, query, level=logging.DEBUG)
 
-        df = self._query_on_driver(query, self.FetchOptions())
+        df = self._query_on_driver(query, self.FetchOptions.parse(None))
         result = df.collect()
 
         log.debug(
@@ -368,19 +368,20 @@ class Hive(DBConnection):
     ) -> tuple[Any, Any]:
         log.info("|%s| Getting min and max values for expression %r ...", self.__class__.__name__, window.expression)
 
-        query = self.dialect.get_sql_query(
+        dialect = self.dialect
+        query = dialect.get_sql_query(
             table=source,
             columns=[
-                self.dialect.aliased(
-                    self.dialect.get_min_value(window.expression),
-                    self.dialect.escape_column("min"),
+                dialect.aliased(
+                    dialect.get_min_value(window.expression),
+                    dialect.escape_column("min"),
                 ),
-                self.dialect.aliased(
-                    self.dialect.get_max_value(window.expression),
-                    self.dialect.escape_column("max"),
+                dialect.aliased(
+                    dialect.get_max_value(window.expression),
+                    dialect.escape_column("max"),
                 ),
             ],
-            where=self.dialect.apply_window(where, window),
+            where=dialect.apply_window(where, window),
             hint=hint,
         )
 
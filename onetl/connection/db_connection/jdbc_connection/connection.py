@@ -123,17 +123,18 @@ class JDBCConnection(JDBCMixin, DBConnection):
             options=self.ReadOptions.parse(options),
         )
 
+        dialect = self.dialect
         new_columns = columns or ["*"]
         alias: str | None = None
 
         if read_options.partition_column:
             if read_options.partitioning_mode == JDBCPartitioningMode.MOD:
-                partition_column = self.dialect.get_partition_column_mod(
+                partition_column = dialect.get_partition_column_mod(
                     read_options.partition_column,
                     read_options.num_partitions,
                 )
             elif read_options.partitioning_mode == JDBCPartitioningMode.HASH:
-                partition_column = self.dialect.get_partition_column_hash(
+                partition_column = dialect.get_partition_column_hash(
                     read_options.partition_column,
                     read_options.num_partitions,
                 )
@@ -145,13 +146,13 @@ class JDBCConnection(JDBCMixin, DBConnection):
             # have the same name as the field in the table ( 2.4 version )
             # https://github.com/apache/spark/pull/21379
             alias = "generated_" + secrets.token_hex(5)
-            alias_escaped = self.dialect.escape_column(alias)
-            aliased_column = self.dialect.aliased(partition_column, alias_escaped)
+            alias_escaped = dialect.escape_column(alias)
+            aliased_column = dialect.aliased(partition_column, alias_escaped)
             read_options = read_options.copy(update={"partition_column": alias_escaped})
             new_columns.append(aliased_column)
 
-        where = self.dialect.apply_window(where, window)
-        query = self.dialect.get_sql_query(
+        where = dialect.apply_window(where, window)
+        query = dialect.get_sql_query(
             table=source,
             columns=new_columns,
             where=where,
@@ -223,19 +224,20 @@ class JDBCConnection(JDBCMixin, DBConnection):
         log.info("|%s| Getting min and max values for expression %r ...", self.__class__.__name__, window.expression)
         read_options = self._exclude_partition_options(self.ReadOptions.parse(options), fetchsize=1)
 
-        query = self.dialect.get_sql_query(
+        dialect = self.dialect
+        query = dialect.get_sql_query(
             table=source,
             columns=[
-                self.dialect.aliased(
-                    self.dialect.get_min_value(window.expression),
-                    self.dialect.escape_column("min"),
+                dialect.aliased(
+                    dialect.get_min_value(window.expression),
+                    dialect.escape_column("min"),
                 ),
-                self.dialect.aliased(
-                    self.dialect.get_max_value(window.expression),
-                    self.dialect.escape_column("max"),
+                dialect.aliased(
+                    dialect.get_max_value(window.expression),
+                    dialect.escape_column("max"),
                 ),
             ],
-            where=self.dialect.apply_window(where, window),
+            where=dialect.apply_window(where, window),
             hint=hint,
         )
 
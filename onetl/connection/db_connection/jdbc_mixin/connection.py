@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+import sys
 import threading
 from abc import abstractmethod
 from contextlib import closing, suppress
+from copy import deepcopy
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Callable, ClassVar, Optional, TypeVar
+from weakref import WeakKeyDictionary
 
 try:
     from pydantic.v1 import Field, PrivateAttr, SecretStr, validator
@@ -15,7 +18,7 @@ except (ImportError, AttributeError):
     from pydantic import Field, PrivateAttr, SecretStr, validator  # type: ignore[no-redef, assignment]
 
 from onetl._metrics.command import SparkCommandMetrics
-from onetl._util.java import get_java_gateway, try_import_java_class
+from onetl._util.java import try_import_java_class
 from onetl._util.spark import (
     estimate_dataframe_size,
     get_spark_version,
@@ -53,6 +56,12 @@ PROHIBITED_OPTIONS = frozenset(
     ),
 )
 
+# drivers already found in Spark session, to avoid calling JVM for every new connection object
+_imported_drivers: WeakKeyDictionary[SparkSession, set[str]] = WeakKeyDictionary()
+
+# used to create thread-local storage of JDBC connection only once, even if connection is used by multiple threads
+_thread_local_lock = threading.Lock()
+
 
 class JDBCStatementType(Enum):
     GENERIC = auto()
@@ -80,8 +89,17 @@ class JDBCMixin(FrozenModel):
     DRIVER: ClassVar[str]
     _CHECK_QUERY: ClassVar[str] = "SELECT 1"
 
-    # cached JDBC connection (Java object), plus corresponding GenericOptions (Python object)
+    # cached JDBC connection and connection properties (Java objects), plus corresponding GenericOptions (Python object).
+    # connection class can be used in multiple threads, and each Python thread creates its own thread in JVM,
+    # so we need thread-local variable to create per-thread persistent connection.
+    # It is created on first use, as threading.local cannot be pickled or deep-copied
     _last_connection_and_options: Optional[threading.local] = PrivateAttr(default=None)
+    # connection is immutable, so jdbc_params converted to strings can be reused
+    _jdbc_params_stringified: Optional[dict] = PrivateAttr(default=None)
+    # Spark JDBC dialect depends only on connection url
+    _spark_dialect: Optional[object] = PrivateAttr(default=None)
+    # constants of java.sql.ResultSet class passed to every statement
+    _statement_args: Optional[tuple] = PrivateAttr(default=None)
 
     @property
     @abstractmethod
@@ -141,8 +159,24 @@ class JDBCMixin(FrozenModel):
     def __del__(self):  # noqa: WPS603
         # If current object is collected by GC, close all opened connections
         # This is safe because closing connection on Spark driver does not influence Spark executors
+        if sys.is_finalizing():
+            # Py4J gateway may be already closed, and JVM will close all connections by itself
+            return
+
         self.close()
 
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        # Connections opened by original object should not be closed by its copy,
+        # and cached values depend on fields which may be changed by .copy(update=...)
+        if deep:
+            values = deepcopy(values)
+
+        result = self.__class__.__new__(self.__class__)
+        object.__setattr__(result, "__dict__", values)
+        object.__setattr__(result, "__fields_set__", fields_set)
+        result._init_private_attributes()
+        return result
+
     @slot
     def check(self):
         log.info("|%s| Checking connection availability...", self.__class__.__name__)
@@ -223,14 +257,7 @@ class JDBCMixin(FrozenModel):
                 raise
 
             log.info("|%s| Query succeeded, created in-memory dataframe.", self.__class__.__name__)
-
-            # as we don't actually use Spark for this method, SparkMetricsRecorder is useless.
-            # Just create metrics by hand, and fill them up using information based on dataframe content.
-            metrics = SparkCommandMetrics()
-            metrics.input.read_rows = df.count()
-            metrics.driver.in_memory_bytes = estimate_dataframe_size(self.spark, df)
-            log.info("|%s| Recorded metrics:", self.__class__.__name__)
-            log_lines(log, str(metrics))
+            self._log_dataframe_metrics(df)
         return df
 
     @slot
@@ -300,18 +327,15 @@ class JDBCMixin(FrozenModel):
                 return None
 
             log.info("|%s| Execution succeeded, created in-memory dataframe.", self.__class__.__name__)
-            # as we don't actually use Spark for this method, SparkMetricsRecorder is useless.
-            # Just create metrics by hand, and fill them up using information based on dataframe content.
-            metrics = SparkCommandMetrics()
-            metrics.input.read_rows = df.count()
-            metrics.driver.in_memory_bytes = estimate_dataframe_size(self.spark, df)
-
-            log.info("|%s| Recorded metrics:", self.__class__.__name__)
-            log_lines(log, str(metrics))
+            self._log_dataframe_metrics(df)
         return df
 
     @validator("spark")
     def _check_java_class_imported(cls, spark):
+        imported_drivers = _imported_drivers.setdefault(spark, set())
+        if cls.DRIVER in imported_drivers:
+            return spark
+
         try:
             try_import_java_class(spark, cls.DRIVER)
         except Exception as e:
@@ -323,6 +347,8 @@ class JDBCMixin(FrozenModel):
             if log.isEnabledFor(logging.DEBUG):
                 log.debug("Missing Java class", exc_info=e, stack_info=True)
             raise ValueError(msg) from e
+
+        imported_drivers.add(cls.DRIVER)
         return spark
 
     def _query_on_driver(
@@ -364,6 +390,20 @@ class JDBCMixin(FrozenModel):
             read_only=False,
         )
 
+    def _log_dataframe_metrics(self, df: DataFrame) -> None:
+        # metrics are only logged, and counting rows runs a Spark job. Skip it if nobody will see the result
+        if not log.isEnabledFor(logging.INFO):
+            return
+
+        # as we don't actually use Spark for this method, SparkMetricsRecorder is useless.
+        # Just create metrics by hand, and fill them up using information based on dataframe content.
+        metrics = SparkCommandMetrics()
+        metrics.input.read_rows = df.count()
+        metrics.driver.in_memory_bytes = estimate_dataframe_size(self.spark, df)
+
+        log.info("|%s| Recorded metrics:", self.__class__.__name__)
+        log_lines(log, str(metrics))
+
     def _get_jdbc_properties(
         self,
         options: GenericOptions,
@@ -372,9 +412,12 @@ class JDBCMixin(FrozenModel):
         """
         Fills up human-readable Options class to a format required by Spark internal methods
         """
-        result = self.jdbc_params
-        result.update(options.dict(by_alias=True, **kwargs))
-        return stringify(result)
+        if self._jdbc_params_stringified is None:
+            self._jdbc_params_stringified = stringify(self.jdbc_params)
+
+        result = self._jdbc_params_stringified.copy()
+        result.update(stringify(options.dict(by_alias=True, **kwargs)))
+        return result
 
     def _options_to_connection_properties(self, options: JDBCFetchOptions | JDBCExecuteOptions):
         """
@@ -388,37 +431,50 @@ class JDBCMixin(FrozenModel):
         """
 
         jdbc_properties = self._get_jdbc_properties(options, exclude_none=True)
-        jdbc_utils_package = self.spark._jvm.org.apache.spark.sql.execution.datasources.jdbc  # type: ignore
+        jvm = self.spark._jvm  # type: ignore
+        jdbc_utils_package = jvm.org.apache.spark.sql.execution.datasources.jdbc
         jdbc_options = jdbc_utils_package.JDBCOptions(
             self.jdbc_url,
             # JDBCOptions class requires `table` argument to be passed, but it is not used in asConnectionProperties
             "table",
-            self.spark._jvm.PythonUtils.toScalaMap(jdbc_properties),  # type: ignore
+            jvm.PythonUtils.toScalaMap(jdbc_properties),
         )
         return jdbc_options.asConnectionProperties()
 
     def _get_jdbc_connection(self, options: JDBCFetchOptions | JDBCExecuteOptions):
-        if not self._last_connection_and_options:
-            # connection class can be used in multiple threads.
-            # each Python thread creates its own thread in JVM
-            # so we need local variable to create per-thread persistent connection
-            self._last_connection_and_options = threading.local()
-
-        with suppress(Exception):  # nothing cached, or JVM failed
-            last_connection, last_options = self._last_connection_and_options.data
-            if options == last_options and not last_connection.isClosed():
-                return last_connection
-
-            # only one connection can be opened in one moment of time
-            last_connection.close()
+        connection_properties = None
+        last_data = getattr(self._last_connection_and_options, "data", None)
+        if last_data:
+            last_connection, last_options, last_properties = last_data
+            with suppress(Exception):  # JVM failed
+                if options == last_options:
+                    if not last_connection.isClosed():
+                        return last_connection
+
+                    # connection was closed by database, but properties are still valid
+                    connection_properties = last_properties
+
+                # only one connection can be opened in one moment of time
+                last_connection.close()
+
+        if connection_properties is None:
+            connection_properties = self._options_to_connection_properties(options)
 
-        connection_properties = self._options_to_connection_properties(options)
         driver_manager = self.spark._jvm.java.sql.DriverManager  # type: ignore
         new_connection = driver_manager.getConnection(self.jdbc_url, connection_properties)
 
-        self._last_connection_and_options.data = (new_connection, options)
+        self._get_thread_local().data = (new_connection, options, connection_properties)
         return new_connection
 
+    def _get_thread_local(self) -> threading.local:
+        if self._last_connection_and_options is None:
+            with _thread_local_lock:
+                # another thread could create storage while current one was waiting for a lock
+                if self._last_connection_and_options is None:
+                    self._last_connection_and_options = threading.local()
+
+        return self._last_connection_and_options
+
     def _get_spark_dialect_name(self) -> str:
         """
         Returns the name of the JDBC dialect associated with the connection URL.
@@ -427,23 +483,31 @@ class JDBCMixin(FrozenModel):
         return dialect.split("$")[0] if "$" in dialect else dialect
 
     def _get_spark_dialect(self):
-        jdbc_dialects_package = self.spark._jvm.org.apache.spark.sql.jdbc
-        return jdbc_dialects_package.JdbcDialects.get(self.jdbc_url)
+        if self._spark_dialect is None:
+            jdbc_dialects_package = self.spark._jvm.org.apache.spark.sql.jdbc  # type: ignore
+            self._spark_dialect = jdbc_dialects_package.JdbcDialects.get(self.jdbc_url)
+
+        return self._spark_dialect
 
     def _close_connections(self):
-        with suppress(Exception):
-            # connection maybe not opened yet
-            last_connection, _ = self._last_connection_and_options.data
+        # object maybe not fully initialized, or connection maybe not opened yet
+        last_connection_and_options = getattr(self, "_last_connection_and_options", None)
+        last_data = getattr(last_connection_and_options, "data", None)
+        if not last_data:
+            return
+
+        last_connection, *_ = last_data
+        with suppress(Exception):  # JVM failed
             last_connection.close()
 
-        with suppress(Exception):
-            # connection maybe not opened yet
-            del self._last_connection_and_options.data
+        del last_connection_and_options.data
 
     def _get_statement_args(self) -> tuple[int, ...]:
-        resultset = self.spark._jvm.java.sql.ResultSet  # type: ignore
+        if self._statement_args is None:
+            resultset = self.spark._jvm.java.sql.ResultSet  # type: ignore
+            self._statement_args = (resultset.TYPE_FORWARD_ONLY, resultset.CONCUR_READ_ONLY)
 
-        return resultset.TYPE_FORWARD_ONLY, resultset.CONCUR_READ_ONLY
+        return self._statement_args
 
     def _execute_on_driver(
         self,
@@ -466,12 +530,13 @@ class JDBCMixin(FrozenModel):
         statement_args = self._get_statement_args()
         jdbc_statement = self._build_statement(statement, statement_type, jdbc_connection, statement_args)
 
-        return self._execute_statement(jdbc_statement, statement, options, callback, read_only)
+        return self._execute_statement(jdbc_statement, statement, statement_type, options, callback, read_only)
 
     def _execute_statement(
         self,
         jdbc_statement,
         statement: str,
+        statement_type: JDBCStatementType,
         options: JDBCFetchOptions | JDBCExecuteOptions,
         callback: Callable[..., T],
         read_only: bool,
@@ -484,12 +549,6 @@ class JDBCMixin(FrozenModel):
         * https://github.com/apache/spark/blob/v2.3.0/sql/core/src/main/scala/org/apache/spark/sql/execution/datasources/jdbc/JDBCRDD.scala#L298-L301
         * https://github.com/apache/spark/blob/v2.3.0/sql/core/src/main/scala/org/apache/spark/sql/execution/datasources/jdbc/JdbcUtils.scala#L103-L105
         """
-        from py4j.java_gateway import is_instance_of
-
-        gateway = get_java_gateway(self.spark)
-        prepared_statement = self.spark._jvm.java.sql.PreparedStatement  # type: ignore
-        callable_statement = self.spark._jvm.java.sql.CallableStatement  # type: ignore
-
         with closing(jdbc_statement):
             if options.fetchsize is not None:
                 jdbc_statement.setFetchSize(options.fetchsize)
@@ -498,9 +557,8 @@ class JDBCMixin(FrozenModel):
                 jdbc_statement.setQueryTimeout(options.query_timeout)
 
             # Java SQL classes are not consistent..
-            if is_instance_of(gateway, jdbc_statement, prepared_statement):
-                jdbc_statement.execute()
-            elif is_instance_of(gateway, jdbc_statement, callable_statement):
+            # statement_type is used instead of checking instance class, to avoid calling JVM
+            if statement_type in {JDBCStatementType.PREPARED, JDBCStatementType.CALL}:
                 jdbc_statement.execute()
             elif read_only:
                 jdbc_statement.executeQuery(statement)
@@ -573,10 +631,9 @@ class JDBCMixin(FrozenModel):
         from pyspark.sql import DataFrame  # noqa: WPS442
 
         jdbc_dialect = self._get_spark_dialect()
-        jdbc_utils_package = self.spark._jvm.org.apache.spark.sql.execution.datasources.jdbc  # type: ignore
-        jdbc_utils = jdbc_utils_package.JdbcUtils
-
-        java_converters = self.spark._jvm.scala.collection.JavaConverters  # type: ignore
+        jvm = self.spark._jvm  # type: ignore
+        jdbc_utils = jvm.org.apache.spark.sql.execution.datasources.jdbc.JdbcUtils
+        java_converters = jvm.scala.collection.JavaConverters
 
         if get_spark_version(self.spark) >= Version("3.4"):
             # https://github.com/apache/spark/commit/2349175e1b81b0a61e1ed90c2d051c01cf78de9b
@@ -585,7 +642,9 @@ class JDBCMixin(FrozenModel):
             result_schema = jdbc_utils.getSchema(result_set, jdbc_dialect, False)  # noqa: WPS425
 
         result_iterator = jdbc_utils.resultSetToRows(result_set, result_schema)
-        result_list = java_converters.seqAsJavaListConverter(result_iterator.toSeq()).asJava()
+        # Iterator.toSeq() returns lazy Stream in Scala 2.12, which wraps every row with a thunk.
+        # toList() reads all rows eagerly, while ResultSet is still open
+        result_list = java_converters.seqAsJavaListConverter(result_iterator.toList()).asJava()
         jdf = self.spark._jsparkSession.createDataFrame(result_list, result_schema)  # type: ignore
 
         # DataFrame constructor in Spark 2.3 and 2.4 required second argument to be a SQLContext class
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Iterable, Mapping
 
 from onetl.connection.db_connection.db_connection.dialect import DBDialect
@@ -14,6 +15,15 @@ from onetl.connection.db_connection.dialect_mixins import (
 )
 from onetl.hwm import Edge, Window
 
+_edge_operators: Mapping[tuple[str, bool], str] = MappingProxyType(
+    {
+        ("start", True): "$gte",
+        ("start", False): "$gt",
+        ("end", True): "$lte",
+        ("end", False): "$lt",
+    },
+)
+
 _upper_level_operators = frozenset(  # noqa: WPS527
     [
         "$addFields",
@@ -143,14 +153,7 @@ class MongoDBDialect(  # noqa: WPS215
         if not expression or not edge.is_set():
             return None
 
-        operators: dict[tuple[str, bool], str] = {
-            ("start", True): "$gte",
-            ("start", False): "$gt",
-            ("end", True): "$lte",
-            ("end", False): "$lt",
-        }
-
-        operator = operators[(position, edge.including)]
+        operator = _edge_operators[(position, edge.including)]
         value = self._serialize_value(edge.value)
         return {
             expression: {
@@ -7,6 +7,11 @@ from typing import ClassVar, Optional
 
 from etl_entities.instance import Host
 
+try:
+    from pydantic.v1 import PrivateAttr
+except (ImportError, AttributeError):
+    from pydantic import PrivateAttr  # type: ignore[no-redef, assignment]
+
 from onetl._util.classproperty import classproperty
 from onetl._util.spark import stringify
 from onetl._util.version import Version
@@ -142,6 +147,9 @@ class Teradata(JDBCConnection):
     DRIVER: ClassVar[str] = "com.teradata.jdbc.TeraDriver"
     _CHECK_QUERY: ClassVar[str] = "SELECT 1 AS check_result"
 
+    # connection is immutable, so there is no need to build url on every call
+    _jdbc_url: Optional[str] = PrivateAttr(default=None)
+
     @slot
     @classmethod
     def get_packages(
@@ -185,6 +193,11 @@ class Teradata(JDBCConnection):
 
     @property
     def jdbc_url(self) -> str:
+        if self._jdbc_url is None:
+            self._jdbc_url = self._build_jdbc_url()
+        return self._jdbc_url
+
+    def _build_jdbc_url(self) -> str:
         # Teradata JDBC driver documentation specifically mentions that params from
         # java.sql.DriverManager.getConnection(url, params) are used to only retrieve 'user' and 'password' values.
         # Other params should be passed via url
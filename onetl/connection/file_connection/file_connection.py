@@ -7,6 +7,7 @@ import threading
 from abc import abstractmethod
 from contextlib import suppress
 from logging import getLogger
+from stat import S_IFMT, S_ISDIR, S_ISREG
 from typing import Any, Iterable, Iterator
 
 from humanize import naturalsize
@@ -165,10 +166,12 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
     @slot
     def resolve_dir(self, path: os.PathLike | str) -> RemoteDirectory:
-        is_dir = self.is_dir(path)
-        stat = self.get_stat(path)
+        remote_path = RemotePath(path)
+        stat = self._get_stat_if_exists(remote_path)
+        if stat is None:
+            raise DirectoryNotFoundError(f"Directory '{remote_path}' does not exist")
 
-        if not is_dir:
+        if not self._is_dir_by_stat(remote_path, stat):
             raise NotADirectoryError(
                 f"{path_repr(RemoteFile(path, stats=stat))} is not a directory",
             )
@@ -177,14 +180,16 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
     @slot
     def resolve_file(self, path: os.PathLike | str) -> RemoteFile:
-        is_file = self.is_file(path)
-        stat = self.get_stat(path)
-        remote_path = RemoteFile(path=path, stats=stat)
+        remote_path = RemotePath(path)
+        stat = self._get_stat_if_exists(remote_path)
+        if stat is None:
+            raise FileNotFoundError(f"File '{remote_path}' does not exist")
 
-        if not is_file:
-            raise NotAFileError(f"{path_repr(remote_path)} is not a file")
+        remote_file = RemoteFile(path=path, stats=stat)
+        if not self._is_file_by_stat(remote_path, stat):
+            raise NotAFileError(f"{path_repr(remote_file)} is not a file")
 
-        return remote_path
+        return remote_file
 
     @slot
     def read_text(self, path: os.PathLike | str, encoding: str = "utf-8", **kwargs) -> str:
@@ -755,6 +760,31 @@ class FileConnection(BaseFileConnection, FrozenModel):
             else:
                 log_with_indent(log, "%s = %r", attr, value)
 
+    def _get_stat_if_exists(self, path: RemotePath) -> PathStatProtocol | None:
+        """
+        Get stat of the path, or ``None`` if path does not exist.
+
+        Connections which can check path existence and get its stat using just one request
+        should override this method.
+        """
+        if not self.path_exists(path):
+            return None
+
+        return self.get_stat(path)
+
+    def _is_dir_by_stat(self, path: RemotePath, stat: PathStatProtocol) -> bool:
+        # use path type from already fetched stat, if it has one, instead of sending one more request
+        if stat.st_mode and S_IFMT(stat.st_mode):
+            return S_ISDIR(stat.st_mode)
+
+        return self._is_dir(path)
+
+    def _is_file_by_stat(self, path: RemotePath, stat: PathStatProtocol) -> bool:
+        if stat.st_mode and S_IFMT(stat.st_mode):
+            return S_ISREG(stat.st_mode)
+
+        return self._is_file(path)
+
     @abstractmethod
     def _get_client(self) -> Any:
         """
@@ -2,9 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-import contextlib
+import codecs
 import os
+import socket
 import textwrap
+import threading
 from logging import getLogger
 from stat import S_ISDIR, S_ISREG
 from typing import Optional
@@ -43,8 +45,42 @@ except (ImportError, NameError) as e:
 
 SSH_CONFIG_PATH = LocalPath("~/.ssh/config").expanduser().resolve()
 
+# number of characters encoded at once by SFTP._write_text
+_WRITE_TEXT_CHUNK_SIZE = 1024 * 1024
+
 log = getLogger(__name__)
 
+# (config file mtime, parsed config). None config means that parsing failed
+_ssh_config_cache: tuple[int, SSHConfig | None] | None = None
+_ssh_config_lock = threading.Lock()
+
+
+def _get_ssh_config() -> SSHConfig | None:
+    # parse file only if it was changed since last call, instead of doing this on every connect
+    global _ssh_config_cache  # noqa: WPS420
+
+    try:
+        mtime = SSH_CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    with _ssh_config_lock:
+        if _ssh_config_cache is not None and _ssh_config_cache[0] == mtime:
+            return _ssh_config_cache[1]
+
+        ssh_conf: SSHConfig | None
+        try:
+            ssh_conf = SSHConfig()
+            ssh_conf.parse(SSH_CONFIG_PATH.read_text())
+        except ConfigParseError:
+            log.exception("Failed to parse SSH config")
+            ssh_conf = None
+        except OSError:
+            return None
+
+        _ssh_config_cache = (mtime, ssh_conf)
+        return ssh_conf
+
 
 @support_hooks
 class SFTP(FileConnection, RenameDirMixin):
@@ -118,6 +154,9 @@ class SFTP(FileConnection, RenameDirMixin):
     host_key_check: bool = False
     compress: bool = True
 
+    # None means that server support of posix rename extension was not checked yet
+    _posix_rename_supported: Optional[bool] = None
+
     @property
     def instance_url(self) -> str:
         return f"{self.__class__.__name__.lower()}://{self.host}:{self.port}"
@@ -127,14 +166,17 @@ class SFTP(FileConnection, RenameDirMixin):
 
     @slot
     def path_exists(self, path: os.PathLike | str) -> bool:
+        return self._get_stat_if_exists(RemotePath(path)) is not None
+
+    def _get_stat_if_exists(self, path: RemotePath) -> SFTPAttributes | None:
         try:
-            self.client.stat(os.fspath(path))
-            return True
+            return self.client.stat(os.fspath(path))
         except FileNotFoundError:
-            return False
+            return None
 
     def _get_client(self) -> SFTPClient:
         host_proxy, key_file = self._parse_user_ssh_config()
+        sock = host_proxy or self._create_socket()
 
         client = SSHClient()
         client.load_system_host_keys()
@@ -150,11 +192,18 @@ class SFTP(FileConnection, RenameDirMixin):
             key_filename=key_file,
             timeout=self.timeout,
             compress=self.compress,
-            sock=host_proxy,
+            sock=sock,
         )
 
         return client.open_sftp()
 
+    def _create_socket(self) -> socket.socket:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        # SFTP sends a lot of small requests, do not delay them for merging with next ones.
+        # Socket buffer sizes are not changed, because this disables kernel autotuning
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
     def _is_client_closed(self, client: SFTPClient) -> bool:
         return not client.sock or client.sock.closed
 
@@ -165,12 +214,11 @@ class SFTP(FileConnection, RenameDirMixin):
         host_proxy = None
         key_file = os.fspath(self.key_file) if self.key_file else None
 
-        if not SSH_CONFIG_PATH.exists() or not SSH_CONFIG_PATH.is_file():
+        ssh_conf = _get_ssh_config()
+        if ssh_conf is None:
             return host_proxy, key_file
 
         try:
-            ssh_conf = SSHConfig()
-            ssh_conf.parse(SSH_CONFIG_PATH.read_text())
             host_info = ssh_conf.lookup(self.host) or {}
             if host_info.get("proxycommand"):
                 host_proxy = ProxyCommand(host_info.get("proxycommand"))
@@ -183,28 +231,44 @@ class SFTP(FileConnection, RenameDirMixin):
         return host_proxy, key_file
 
     def _create_dir(self, path: RemotePath) -> None:
+        # in most cases parent directory already exists, so try to create directory without any checks.
+        # parents are checked only if this failed, starting from the closest one
+        path_str = os.fspath(path)
         try:
-            self.client.stat(os.fspath(path))
-        except Exception:
-            for parent in reversed(path.parents):
-                try:  # noqa: WPS505
-                    self.client.stat(os.fspath(parent))
-                except Exception:
-                    self.client.mkdir(os.fspath(parent))
+            self.client.mkdir(path_str)
+            return
+        except OSError:
+            if self._get_stat_if_exists(path) is not None:
+                # already created, e.g. by another thread
+                return
+
+            if path.parent == path or self._get_stat_if_exists(path.parent) is not None:
+                raise
 
-            self.client.mkdir(os.fspath(path))
+        self._create_dir(path.parent)
+        self.client.mkdir(path_str)
 
     def _upload_file(self, local_file_path: RemotePath, remote_file_path: RemotePath) -> None:
         self.client.put(os.fspath(local_file_path), os.fspath(remote_file_path))
 
     def _rename_file(self, source: RemotePath, target: RemotePath) -> None:
-        with contextlib.suppress(OSError):
-            self.client.posix_rename(os.fspath(source), os.fspath(target))
-            return
+        source_str = os.fspath(source)
+        target_str = os.fspath(target)
+        if self._posix_rename_supported is not False:
+            try:
+                self.client.posix_rename(source_str, target_str)
+                self._posix_rename_supported = True
+                return
+            except OSError:
+                pass
 
         # posix rename extension is not supported by server
         # if OSError was caused by permissions error, client.rename will raise this exception again
-        self.client.rename(os.fspath(source), os.fspath(target))
+        self.client.rename(source_str, target_str)
+        if self._posix_rename_supported is None:
+            # plain rename succeeded, so posix rename failed only because server does not support it.
+            # do not send requests which will fail anyway
+            self._posix_rename_supported = False
 
     _rename_dir = _rename_file
 
@@ -221,12 +285,10 @@ class SFTP(FileConnection, RenameDirMixin):
         return self.client.listdir_attr(os.fspath(path))
 
     def _is_dir(self, path: RemotePath) -> bool:
-        stat: SFTPAttributes = self.client.stat(os.fspath(path))
-        return S_ISDIR(stat.st_mode)
+        return S_ISDIR(self._get_stat(path).st_mode)
 
     def _is_file(self, path: RemotePath) -> bool:
-        stat: SFTPAttributes = self.client.stat(os.fspath(path))
-        return S_ISREG(stat.st_mode)
+        return S_ISREG(self._get_stat(path).st_mode)
 
     def _get_stat(self, path: RemotePath) -> SFTPAttributes:
         # underlying SFTP client already return `os.stat_result`-like class
@@ -245,17 +307,31 @@ class SFTP(FileConnection, RenameDirMixin):
         return entry
 
     def _read_text(self, path: RemotePath, encoding: str, **kwargs) -> str:
-        with self.client.open(os.fspath(path), mode="r", **kwargs) as file:
-            return file.read().decode(encoding)
+        return self._read_bytes(path, **kwargs).decode(encoding)
 
     def _read_bytes(self, path: RemotePath, **kwargs) -> bytes:
         with self.client.open(os.fspath(path), mode="r", **kwargs) as file:
+            # send all read requests at once instead of waiting for a response to each of them,
+            # like SFTPClient.get() does
+            file.prefetch()
             return file.read()
 
     def _write_text(self, path: RemotePath, content: str, encoding: str, **kwargs) -> None:
+        if len(content) <= _WRITE_TEXT_CHUNK_SIZE:
+            self._write_bytes(path, content.encode(encoding), **kwargs)
+            return
+
+        # encode large content by chunks instead of creating a copy of the whole content in memory
+        encoder = codecs.getincrementalencoder(encoding)()
         with self.client.open(os.fspath(path), mode="w", **kwargs) as file:
-            file.write(content.encode(encoding))
+            file.set_pipelined(True)
+            for start in range(0, len(content), _WRITE_TEXT_CHUNK_SIZE):
+                file.write(encoder.encode(content[start : start + _WRITE_TEXT_CHUNK_SIZE]))
+            file.write(encoder.encode("", final=True))
 
     def _write_bytes(self, path: RemotePath, content: bytes, **kwargs) -> None:
         with self.client.open(os.fspath(path), mode="w", **kwargs) as file:
+            # do not wait for a server response to each write request, like SFTPClient.put() does.
+            # errors are raised on file close
+            file.set_pipelined(True)
             file.write(content)
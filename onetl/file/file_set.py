@@ -40,9 +40,20 @@ class FileSet(OrderedSet[T], Generic[T]):
         1024
         """
 
-        return sum(
-            file.stat().st_size or 0 for file in self if isinstance(file, PathWithStatsProtocol) and file.exists()
-        )
+        result = 0
+        for file in self:
+            if not isinstance(file, PathWithStatsProtocol):
+                continue
+
+            try:
+                # for local files this is one syscall instead of two (.exists() + .stat()),
+                # remote files already contain stats received while listing the directory
+                result += file.stat().st_size or 0
+            except (FileNotFoundError, NotADirectoryError):
+                # same as .exists() returning False
+                continue
+
+        return result
 
     def raise_if_empty(self) -> None:
         """
@@ -6,7 +6,8 @@ import logging
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
-from typing import Iterable, Optional, Tuple
+from stat import S_ISREG
+from typing import ClassVar, Iterable, List, Optional, Tuple
 
 from ordered_set import OrderedSet
 
@@ -29,6 +30,8 @@ from onetl.impl import (
     FileExistBehavior,
     FrozenModel,
     LocalPath,
+    RemoteDirectory,
+    RemoteFile,
     RemotePath,
     path_repr,
 )
@@ -37,7 +40,7 @@ from onetl.log import entity_boundary_log, log_lines, log_options, log_with_inde
 log = logging.getLogger(__name__)
 
 # source, target, temp
-UPLOAD_ITEMS_TYPE = OrderedSet[Tuple[LocalPath, RemotePath, Optional[RemotePath]]]
+UPLOAD_ITEMS_TYPE = List[Tuple[LocalPath, RemotePath, Optional[RemotePath]]]
 
 
 class FileUploadStatus(Enum):
@@ -156,6 +159,11 @@ class FileUploader(FrozenModel):
 
     _connection_checked: bool = PrivateAttr(default=False)
 
+    # Target directory is listed only if at least this number of files is uploaded to it.
+    # Listing costs one request per directory but returns all its entries, so for a few files
+    # uploaded to a huge directory checking existence of each file separately is cheaper
+    _list_dir_min_files: ClassVar[int] = 100
+
     @slot
     def run(self, files: Iterable[str | os.PathLike] | None = None) -> UploadResult:
         """
@@ -362,7 +370,8 @@ class FileUploader(FrozenModel):
         try:
             for root, dirs, files in os.walk(self.local_path):
                 log.debug("|Local FS| Listing dir '%s': %d dirs, %d files", root, len(dirs), len(files))
-                result.update(LocalPath(root) / file for file in files)
+                root_path = LocalPath(root)
+                result.update(root_path / file for file in files)
         except Exception as e:
             raise RuntimeError(
                 f"Couldn't read directory tree from local dir '{self.local_path}'",
@@ -383,11 +392,13 @@ class FileUploader(FrozenModel):
         return RemotePath(temp_path) if temp_path else None
 
     def _log_parameters(self, files: Iterable[str | os.PathLike] | None = None) -> None:
-        log.info("|Local FS| -> |%s| Uploading files using parameters:'", self.connection.__class__.__name__)
-        log_with_indent(log, "local_path = %s", f"'{self.local_path}'" if self.local_path else "None")
-        log_with_indent(log, "target_path = '%s'", self.target_path)
-        log_with_indent(log, "temp_path = %s", f"'{self.temp_path}'" if self.temp_path else "None")
-        log_options(log, self.options.dict(by_alias=True))
+        if log.isEnabledFor(logging.INFO):
+            # do not build options dict if it will not be logged anyway
+            log.info("|Local FS| -> |%s| Uploading files using parameters:'", self.connection.__class__.__name__)
+            log_with_indent(log, "local_path = %s", f"'{self.local_path}'" if self.local_path else "None")
+            log_with_indent(log, "target_path = '%s'", self.target_path)
+            log_with_indent(log, "temp_path = %s", f"'{self.temp_path}'" if self.temp_path else "None")
+            log_options(log, self.options.dict(by_alias=True))
 
         if self.options.delete_local:
             log.warning("|%s| LOCAL FILES WILL BE PERMANENTLY DELETED AFTER UPLOADING !!!", self.__class__.__name__)
@@ -406,7 +417,8 @@ class FileUploader(FrozenModel):
         local_files: Iterable[os.PathLike | str],
         current_temp_dir: RemotePath | None,
     ) -> UPLOAD_ITEMS_TYPE:
-        result = OrderedSet()
+        # target and temp paths depend only on local file path, so deduplicate items by it
+        result: dict[LocalPath, tuple[LocalPath, RemotePath, RemotePath | None]] = {}
 
         for file in local_files:
             local_file_path = LocalPath(file)
@@ -439,12 +451,19 @@ class FileUploader(FrozenModel):
                     # Wrong path (not relative path and source path not in the path to the file)
                     raise ValueError(f"File path '{local_file}' does not match source_path '{self.local_path}'")
 
-            if local_file.exists() and not local_file.is_file():
+            try:
+                # one syscall instead of two (.exists() + .is_file())
+                is_file = S_ISREG(local_file.stat().st_mode)
+            except (FileNotFoundError, NotADirectoryError):
+                # missing files are handled during upload
+                is_file = True
+
+            if not is_file:
                 raise NotAFileError(f"{path_repr(local_file)} is not a file")
 
-            result.add((local_file, target_file, tmp_file))
+            result.setdefault(local_file, (local_file, target_file, tmp_file))
 
-        return result
+        return list(result.values())
 
     def _check_local_path(self):
         if not self.local_path.exists():
@@ -461,9 +480,10 @@ class FileUploader(FrozenModel):
         log.info("|%s| Starting the upload process...", self.__class__.__name__)
 
         self._create_dirs(to_upload)
+        existing_files = self._get_existing_files(to_upload)
 
         result = UploadResult()
-        for status, file in self._bulk_upload(to_upload):
+        for status, file in self._bulk_upload(to_upload, existing_files):
             if status == FileUploadStatus.SUCCESSFUL:
                 result.successful.add(file)
             elif status == FileUploadStatus.FAILED:
@@ -492,9 +512,51 @@ class FileUploader(FrozenModel):
         for parent_path in parent_paths:
             self.connection.create_dir(parent_path)
 
+    def _get_existing_files(
+        self,
+        to_upload: UPLOAD_ITEMS_TYPE,
+    ) -> dict[RemotePath, dict[str, RemoteDirectory | RemoteFile]]:
+        """
+        List target directories with many files to be uploaded,
+        instead of checking existence of every target file separately.
+
+        Returns mapping ``target_dir -> {entry name: entry}``.
+        Directories which are not listed are absent in the mapping,
+        so existence of each file should be checked separately.
+        """
+        files_per_dir: dict[RemotePath, int] = {}
+        for _, target_file, _ in to_upload:
+            files_per_dir[target_file.parent] = files_per_dir.get(target_file.parent, 0) + 1
+
+        result: dict[RemotePath, dict[str, RemoteDirectory | RemoteFile]] = {}
+        for target_dir, files_count in files_per_dir.items():
+            if files_count < self._list_dir_min_files:
+                continue
+
+            try:
+                entries = self.connection.list_dir(target_dir)
+            except DirectoryNotFoundError:
+                # some file systems, like S3, do not have real directories
+                result[target_dir] = {}
+                continue
+            except PermissionError as e:
+                # e.g. listing is not allowed in upload-only directory
+                log.debug(
+                    "|%s| Cannot list directory '%s', checking each file separately",
+                    self.__class__.__name__,
+                    target_dir,
+                    exc_info=e,
+                )
+                continue
+
+            result[target_dir] = {entry.name: entry for entry in entries}
+
+        return result
+
     def _bulk_upload(
         self,
         to_upload: UPLOAD_ITEMS_TYPE,
+        existing_files: dict[RemotePath, dict[str, RemoteDirectory | RemoteFile]],
     ) -> list[tuple[FileUploadStatus, PurePathProtocol | PathWithStatsProtocol]]:
         workers = self.options.workers
         files_count = len(to_upload)
@@ -513,11 +575,11 @@ class FileUploader(FrozenModel):
         if real_workers > 1:
             log.debug("|%s| Using ThreadPoolExecutor with %d workers", self.__class__.__name__, real_workers)
             with ThreadPoolExecutor(
-                max_workers=workers,
+                max_workers=real_workers,
                 thread_name_prefix=self.__class__.__name__,
             ) as executor:
                 futures = [
-                    executor.submit(self._upload_file, local_file, target_file, tmp_file)
+                    executor.submit(self._upload_file, local_file, target_file, tmp_file, existing_files)
                     for local_file, target_file, tmp_file in to_upload
                 ]
                 for future in as_completed(futures):
@@ -530,16 +592,42 @@ class FileUploader(FrozenModel):
                         local_file,
                         target_file,
                         tmp_file,
+                        existing_files,
                     ),
                 )
 
         return result
 
+    def _get_existing_file(
+        self,
+        target_file: RemotePath,
+        existing_files: dict[RemotePath, dict[str, RemoteDirectory | RemoteFile]],
+    ) -> RemoteFile | None:
+        dir_entries = existing_files.get(target_file.parent)
+        if dir_entries is None:
+            # directory was not listed
+            if not self.connection.path_exists(target_file):
+                return None
+            return self.connection.resolve_file(target_file)
+
+        existing_file = dir_entries.get(target_file.name)
+        if existing_file is None:
+            return None
+
+        st_mode = existing_file.stats.st_mode
+        if existing_file.is_file() and (st_mode is None or S_ISREG(st_mode)):
+            return RemoteFile(path=target_file, stats=existing_file.stats)
+
+        # entry can be a symlink, so follow it like other connection methods do.
+        # raises NotAFileError if this is not a file
+        return self.connection.resolve_file(target_file)
+
     def _upload_file(  # noqa: WPS231
         self,
         local_file: LocalPath,
         target_file: RemotePath,
         tmp_file: RemotePath | None,
+        existing_files: dict[RemotePath, dict[str, RemoteDirectory | RemoteFile]],
     ) -> tuple[FileUploadStatus, PurePathProtocol | PathWithStatsProtocol]:
         if tmp_file:
             log.info(
@@ -558,8 +646,8 @@ class FileUploader(FrozenModel):
 
         try:
             replace = False
-            if self.connection.path_exists(target_file):
-                file = self.connection.resolve_file(target_file)
+            file = self._get_existing_file(target_file, existing_files)
+            if file is not None:
                 if self.options.if_exists == FileExistBehavior.ERROR:
                     raise FileExistsError(f"File {path_repr(file)} already exists")
 
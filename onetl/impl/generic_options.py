@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import re
 from fnmatch import fnmatch
+from functools import lru_cache
 from typing import Iterable, TypeVar
 
 try:
@@ -36,8 +37,12 @@ class GenericOptions(FrozenModel):
         Otherwise, an exception will be raised
         """
 
+        if type(options) is cls:
+            # most common case, options object is already created by user
+            return options
+
         if not options:
-            return cls()
+            return cls._get_default()
 
         if isinstance(options, dict):
             return cls.parse_obj(options)
@@ -49,6 +54,17 @@ class GenericOptions(FrozenModel):
 
         return options
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_default(cls: type[T]) -> T:
+        # options are frozen, so instance with default values can be safely shared
+        return cls()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_field_names(cls) -> frozenset[str]:
+        return frozenset(cls.__fields__)
+
     @root_validator(pre=True)
     def _strip_prefixes(cls, values):
         prefixes = cls.__config__.strip_prefixes  # type: ignore[attr-defined]
@@ -89,7 +105,7 @@ class GenericOptions(FrozenModel):
         if not prohibited:
             return values
 
-        unknown_options = set(values) - set(cls.__fields__)
+        unknown_options = values.keys() - cls._get_field_names()
         if not unknown_options:
             return values
 
@@ -112,7 +128,7 @@ class GenericOptions(FrozenModel):
         if known_options is None:
             return values
 
-        current_options = set(values) - set(cls.__fields__)
+        current_options = values.keys() - cls._get_field_names()
         already_known = set(cls._get_matching_options(current_options, known_options))
         unknown_options = sorted(current_options - already_known)
         if not unknown_options:
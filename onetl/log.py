@@ -248,6 +248,9 @@ def log_lines(
 
     """
 
+    if not logger.isEnabledFor(level):
+        return
+
     base_indent = " " * (BASE_LOG_INDENT + indent)
     stacklevel += 1
     for index, line in enumerate(dedent(inp).splitlines()):
@@ -292,6 +295,9 @@ def log_json(
 
     """
 
+    if not logger.isEnabledFor(level):
+        return
+
     log_lines(logger, json.dumps(inp, indent=4), name, indent, level, stacklevel=stacklevel + 1)
 
 
@@ -348,6 +354,9 @@ def log_collection(
 
     """
 
+    if not logger.isEnabledFor(level):
+        return
+
     base_indent = " " * (BASE_LOG_INDENT + indent)
     stacklevel += 1
     items = list(collection)  # force convert all iterators to list to know size
@@ -440,6 +449,9 @@ def log_options(
 
     """
 
+    if not logger.isEnabledFor(kwargs.get("level", logging.INFO)):
+        return
+
     stacklevel += 1
     if options:
         log_with_indent(logger, "%s = {", name, indent=indent, stacklevel=stacklevel, **kwargs)
@@ -477,6 +489,9 @@ def log_dataframe_schema(logger: logging.Logger, df: DataFrame, indent: int = 0,
 
     """
 
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     stacklevel += 1
     log_with_indent(logger, "df_schema:", indent=indent, stacklevel=stacklevel)
 
@@ -3,31 +3,47 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from onetl.hwm import Edge
 from onetl.impl import BaseModel
 from onetl.log import log_with_indent
 
+if TYPE_CHECKING:
+    from onetl.strategy.strategy_manager import StrategyManager
+
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_strategy_manager() -> type[StrategyManager]:
+    # hack to avoid circular imports. Import is performed only once
+    from onetl.strategy.strategy_manager import StrategyManager
+
+    return StrategyManager
+
+
 class BaseStrategy(BaseModel):
     def __enter__(self):
-        # hack to avoid circular imports
-        from onetl.strategy.strategy_manager import StrategyManager
-
-        log.debug("|%s| Entered stack at level %d", self.__class__.__name__, StrategyManager.get_current_level())
-        StrategyManager.push(self)
+        strategy_manager = _get_strategy_manager()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("|%s| Entered stack at level %d", self.__class__.__name__, strategy_manager.get_current_level())
+        strategy_manager.push(self)
 
         self._log_parameters()
         self.enter_hook()
         return self
 
     def __exit__(self, exc_type, _exc_value, _traceback):
-        from onetl.strategy.strategy_manager import StrategyManager
-
-        log.debug("|%s| Exiting stack at level %d", self.__class__.__name__, StrategyManager.get_current_level() - 1)
-        strategy = StrategyManager.pop()
+        strategy_manager = _get_strategy_manager()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "|%s| Exiting stack at level %d",
+                self.__class__.__name__,
+                strategy_manager.get_current_level() - 1,
+            )
+        strategy = strategy_manager.pop()
 
         failed = bool(exc_type)
         if failed:
@@ -53,11 +69,16 @@ class BaseStrategy(BaseModel):
         pass
 
     def _log_parameters(self) -> None:
+        if not log.isEnabledFor(logging.INFO):
+            return
+
         log.info("|onETL| Using %s as a strategy", self.__class__.__name__)
         parameters = self.dict(by_alias=True, exclude_none=True, exclude=self._log_exclude_fields())
-        for attr, value in sorted(parameters.items()):
+        # fields are logged in order of declaration
+        for attr, value in parameters.items():
             log_with_indent(log, "%s = %r", attr, value)
 
     @classmethod
-    def _log_exclude_fields(cls) -> set[str]:
-        return set()
+    @lru_cache(maxsize=None)
+    def _log_exclude_fields(cls) -> frozenset[str]:
+        return frozenset()
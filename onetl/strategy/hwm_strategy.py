@@ -6,6 +6,7 @@ import logging
 import os
 import textwrap
 import warnings
+from functools import lru_cache
 from typing import Any, Optional
 
 from etl_entities.hwm import HWM
@@ -138,5 +139,6 @@ class HWMStrategy(BaseStrategy):
                 log_with_indent(log, "location = %r", location)
 
     @classmethod
-    def _log_exclude_fields(cls) -> set[str]:
+    @lru_cache(maxsize=None)
+    def _log_exclude_fields(cls) -> frozenset[str]:
         return super()._log_exclude_fields() | {"hwm"}
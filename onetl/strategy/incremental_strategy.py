@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Optional
 
 from etl_entities.hwm import HWM
@@ -674,5 +675,6 @@ class IncrementalBatchStrategy(OffsetMixin, BatchHWMStrategy):
         return super().__next__()
 
     @classmethod
-    def _log_exclude_fields(cls) -> set[str]:
+    @lru_cache(maxsize=None)
+    def _log_exclude_fields(cls) -> frozenset[str]:
         return super()._log_exclude_fields() | {"start"}
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from datetime import date, datetime, timedelta
 from logging import getLogger
 from random import randint
@@ -127,23 +126,31 @@ class BaseProcessing(ABC):
     ) -> pandas.DataFrame:
         time_multiplier = 100000
 
-        values = defaultdict(list)
-        for i in range(min_id, max_id + 1):
-            for column in self.column_names:
-                column_name = column.lower()
-
-                if "int" in column_name:
-                    values[column].append(i)
-                elif "float" in column_name:
-                    values[column].append(float(f"{i}.{i}"))
-                elif "text" in column_name:
-                    values[column].append("This line is made to test the work")
-                elif "datetime" in column_name:
-                    rand_second = randint(0, i * time_multiplier)  # noqa: S311
-                    values[column].append(self.current_datetime() + timedelta(seconds=rand_second))
-                elif "date" in column_name:
-                    rand_second = randint(0, i * time_multiplier)  # noqa: S311
-                    values[column].append(self.current_date() + timedelta(seconds=rand_second))
+        ids = range(min_id, max_id + 1)
+        current_datetime = self.current_datetime()
+        current_date = self.current_date()
+
+        # fill data column by column, to detect column type only once
+        values = {}
+        for column in self.column_names:
+            column_name = column.lower()
+
+            if "int" in column_name:
+                values[column] = list(ids)
+            elif "float" in column_name:
+                values[column] = [float(f"{i}.{i}") for i in ids]
+            elif "text" in column_name:
+                values[column] = ["This line is made to test the work"] * len(ids)
+            elif "datetime" in column_name:
+                values[column] = [
+                    current_datetime + timedelta(seconds=randint(0, i * time_multiplier))  # noqa: S311
+                    for i in ids
+                ]
+            elif "date" in column_name:
+                values[column] = [
+                    current_date + timedelta(seconds=randint(0, i * time_multiplier))  # noqa: S311
+                    for i in ids
+                ]
 
         return pandas.DataFrame(data=values)
 
@@ -153,7 +160,20 @@ class BaseProcessing(ABC):
         min_id: int = 1,
         max_id: int = _df_max_length,
     ) -> SparkDataFrame:
-        return spark.createDataFrame(self.create_pandas_df(min_id=min_id, max_id=max_id))
+        pandas_df = self.create_pandas_df(min_id=min_id, max_id=max_id)
+
+        # convert pandas DataFrame using Arrow instead of row by row.
+        # Enabled only here to avoid changing results of .toPandas() used in assertions
+        arrow_option = "spark.sql.execution.arrow.pyspark.enabled"
+        previous_value = spark.conf.get(arrow_option, None)
+        spark.conf.set(arrow_option, "true")
+        try:
+            return spark.createDataFrame(pandas_df)
+        finally:
+            if previous_value is None:
+                spark.conf.unset(arrow_option)
+            else:
+                spark.conf.set(arrow_option, previous_value)
 
     def fix_pandas_df(
         self,
@@ -90,10 +90,19 @@ class KafkaProcessing(BaseProcessing):
             raise KafkaException(f"Message {msg} delivery failed: {err}")
 
     def send_message(self, topic, message, timeout: float = DEFAULT_TIMEOUT):
+        self.send_messages(topic, [message], timeout=timeout)
+
+    def send_messages(self, topic, messages, timeout: float = DEFAULT_TIMEOUT):
         from confluent_kafka import KafkaException
 
+        # use the same producer for all messages, and wait for delivery only once
         producer = self.get_producer()
-        producer.produce(topic, message, callback=self.delivery_report)
+        for i, message in enumerate(messages, start=1):
+            producer.produce(topic, message, callback=self.delivery_report)
+            if i % 1000 == 0:
+                # serve delivery callbacks to avoid overflowing producer queue
+                producer.poll(0)
+
         messages_left = producer.flush(timeout)
         if messages_left:
             raise KafkaException(f"{messages_left} messages were not delivered")
@@ -160,9 +169,8 @@ class KafkaProcessing(BaseProcessing):
         admin.delete_topics(topics, request_timeout=timeout)
 
     def insert_pandas_df_into_topic(self, df: pandas.DataFrame, topic: str):
-        for _, row in df.iterrows():
-            message = json.dumps(row.to_dict())
-            self.send_message(topic, message.encode("utf-8"))
+        messages = (json.dumps(row.to_dict()).encode("utf-8") for _, row in df.iterrows())
+        self.send_messages(topic, messages)
 
     def topic_exists(self, topic: str, timeout: float = DEFAULT_TIMEOUT) -> bool:
         admin = self.get_admin_client()
@@ -94,6 +94,20 @@ def test_file_set_details():
     assert empty_file_set.details == empty_file_set.summary == str(empty_file_set) == "No files"
 
 
+def test_file_set_total_size_skips_missing_local_files(tmp_path):
+    existing = LocalPath(tmp_path / "file.txt")
+    existing.write_bytes(b"x" * 10)
+
+    files = [
+        existing,
+        LocalPath(tmp_path / "missing.txt"),
+        # parent is a regular file, stat() raises NotADirectoryError
+        LocalPath(existing / "nested.txt"),
+    ]
+
+    assert FileSet(files).total_size == 10
+
+
 def test_file_set_raise_if_empty():
     empty_file_set = FileSet()
 
@@ -1,9 +1,13 @@
 import re
 import textwrap
+from stat import S_IFLNK, S_IFREG
+from unittest.mock import Mock
 
 import pytest
 
+from onetl.base import BaseFileConnection
 from onetl.file import FileUploader
+from onetl.impl import LocalPath, RemoteFile, RemotePath, RemotePathStat
 from onetl.impl.file_exist_behavior import FileExistBehavior
 
 
@@ -76,3 +80,141 @@ def test_file_uploader_options_mode_deprecated(options, value, message):
 def test_file_uploader_options_modes_wrong():
     with pytest.raises(ValueError, match="value is not a valid enumeration member"):
         FileUploader.Options(mode="wrong_mode")
+
+
+
+def test_file_uploader_lists_target_dir_with_many_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(FileUploader, "_list_dir_min_files", 3)
+
+    files = []
+    for i in range(3):
+        local_file = LocalPath(tmp_path / f"file{i}.txt")
+        local_file.write_text("content")
+        files.append(local_file)
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.list_dir.return_value = [
+        RemoteFile(path="file0.txt", stats=RemotePathStat(st_size=10, st_mode=S_IFREG | 0o644)),
+        # symlink to a file, should be resolved
+        RemoteFile(path="file1.txt", stats=RemotePathStat(st_size=10, st_mode=S_IFLNK | 0o777)),
+    ]
+    connection.resolve_file.return_value = RemoteFile(path="/target/file1.txt", stats=RemotePathStat(st_size=10))
+    connection.upload_file.side_effect = lambda local_file, target_file, replace: RemoteFile(
+        path=target_file,
+        stats=RemotePathStat(st_size=local_file.stat().st_size),
+    )
+
+    uploader = FileUploader(connection=connection, target_path="/target", options={"if_exists": "ignore"})
+    result = uploader.run(files)
+
+    connection.list_dir.assert_called_once_with(RemotePath("/target"))
+    connection.path_exists.assert_not_called()
+    connection.resolve_file.assert_called_once_with(RemotePath("/target/file1.txt"))
+    assert result.skipped == {files[0], files[1]}
+    assert result.successful == {RemotePath("/target/file2.txt")}
+    assert not result.failed
+
+
+def test_file_uploader_does_not_list_target_dir_with_few_files(tmp_path):
+    files = []
+    for i in range(2):
+        local_file = LocalPath(tmp_path / f"file{i}.txt")
+        local_file.write_text("content")
+        files.append(local_file)
+
+    # target directory may contain lots of files, checking each uploaded file is cheaper
+    connection = Mock(spec=BaseFileConnection)
+    connection.path_exists.side_effect = lambda path: path == RemotePath("/target/file0.txt")
+    connection.resolve_file.return_value = RemoteFile(path="/target/file0.txt", stats=RemotePathStat(st_size=10))
+    connection.upload_file.side_effect = lambda local_file, target_file, replace: RemoteFile(
+        path=target_file,
+        stats=RemotePathStat(st_size=local_file.stat().st_size),
+    )
+
+    uploader = FileUploader(connection=connection, target_path="/target", options={"if_exists": "ignore"})
+    result = uploader.run(files)
+
+    connection.list_dir.assert_not_called()
+    assert connection.path_exists.call_count == 2
+    assert result.skipped == {files[0]}
+    assert result.successful == {RemotePath("/target/file1.txt")}
+    assert not result.failed
+
+
+def test_file_uploader_target_dir_listing_denied(tmp_path, monkeypatch):
+    monkeypatch.setattr(FileUploader, "_list_dir_min_files", 3)
+
+    files = []
+    for i in range(3):
+        local_file = LocalPath(tmp_path / f"file{i}.txt")
+        local_file.write_text("content")
+        files.append(local_file)
+
+    # e.g. upload-only directory
+    connection = Mock(spec=BaseFileConnection)
+    connection.list_dir.side_effect = PermissionError("Permission denied")
+    connection.path_exists.return_value = False
+    connection.upload_file.side_effect = lambda local_file, target_file, replace: RemoteFile(
+        path=target_file,
+        stats=RemotePathStat(st_size=local_file.stat().st_size),
+    )
+
+    uploader = FileUploader(connection=connection, target_path="/target")
+    result = uploader.run(files)
+
+    connection.list_dir.assert_called_once_with(RemotePath("/target"))
+    assert connection.path_exists.call_count == 3
+    assert len(result.successful) == 3
+    assert not result.failed
+
+
+def test_file_uploader_target_dir_listing_connection_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(FileUploader, "_list_dir_min_files", 3)
+
+    files = []
+    for i in range(3):
+        local_file = LocalPath(tmp_path / f"file{i}.txt")
+        local_file.write_text("content")
+        files.append(local_file)
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.list_dir.side_effect = ConnectionResetError("Connection reset by peer")
+
+    uploader = FileUploader(connection=connection, target_path="/target")
+    with pytest.raises(ConnectionResetError):
+        uploader.run(files)
+
+    connection.upload_file.assert_not_called()
+
+
+def test_file_uploader_missing_local_file(tmp_path):
+    missing_file = LocalPath(tmp_path / "missing.txt")
+
+    connection = Mock(spec=BaseFileConnection)
+    connection.path_exists.return_value = False
+
+    uploader = FileUploader(connection=connection, target_path="/target")
+    result = uploader.run([missing_file])
+
+    assert result.missing == {missing_file}
+    connection.upload_file.assert_not_called()
+
+
+def test_file_uploader_local_file_stat_error(tmp_path, monkeypatch):
+    local_file = LocalPath(tmp_path / "file.txt")
+    local_file.write_text("content")
+
+    def stat(self, *args, **kwargs):
+        raise PermissionError(f"Permission denied: '{self}'")
+
+    monkeypatch.setattr(LocalPath, "stat", stat)
+
+    # only missing files are skipped, other errors are raised before upload is started
+    connection = Mock(spec=BaseFileConnection)
+    uploader = FileUploader(connection=connection, target_path="/target")
+    with pytest.raises(PermissionError):
+        uploader.run([local_file])
+
+    # only target_path is created, upload is not started
+    connection.create_dir.assert_called_once_with(RemotePath("/target"))
+    connection.upload_file.assert_not_called()
@@ -1,3 +1,4 @@
+import copy
 import re
 
 import pytest
@@ -96,6 +97,16 @@ def test_postgres(spark_mock):
     assert str(conn) == "Postgres[some_host:5432/database]"
 
 
+def test_postgres_deepcopy(spark_mock):
+    conn = Postgres(host="some_host", user="user", database="database", password="passwd", spark=spark_mock)
+    conn_copy = copy.deepcopy(conn)
+
+    assert conn_copy is not conn
+    assert conn_copy.host == "some_host"
+    assert conn_copy.password.get_secret_value() == "passwd"
+    assert conn_copy.jdbc_url == conn.jdbc_url
+
+
 def test_postgres_with_port(spark_mock):
     conn = Postgres(host="some_host", port=5000, user="user", database="database", password="passwd", spark=spark_mock)
 
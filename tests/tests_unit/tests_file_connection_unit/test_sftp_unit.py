@@ -1,5 +1,7 @@
 import shutil
 from pathlib import Path
+from stat import S_IFDIR, S_IFREG
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -91,3 +93,124 @@ def test_sftp_connection_without_mandatory_args():
 
     with pytest.raises(ValueError):
         SFTP()
+
+
+@pytest.fixture
+def sftp_client_mock(monkeypatch):
+    from paramiko.sftp_attr import SFTPAttributes
+
+    from onetl.connection import SFTP
+
+    def stat(path):
+        attrs = SFTPAttributes()
+        attrs.st_size = 10
+        attrs.st_mtime = 50
+        if path == "/some/dir":
+            attrs.st_mode = S_IFDIR
+        elif path == "/some/file.txt":
+            attrs.st_mode = S_IFREG
+        else:
+            raise FileNotFoundError(path)
+        return attrs
+
+    client = Mock()
+    client.stat.side_effect = stat
+    monkeypatch.setattr(SFTP, "_get_client", lambda self: client)
+    monkeypatch.setattr(SFTP, "_is_client_closed", lambda self, client: False)
+    return client
+
+
+def test_sftp_connection_resolve_file(sftp_client_mock):
+    from onetl.connection import SFTP
+    from onetl.impl import RemotePath
+
+    conn = SFTP(host="some_host")
+    assert conn.path_exists("/some/file.txt")
+    assert conn.is_file("/some/file.txt")
+
+    sftp_client_mock.stat.reset_mock()
+    remote_file = conn.resolve_file("/some/file.txt")
+    assert remote_file == RemotePath("/some/file.txt")
+    assert remote_file.stat().st_size == 10
+
+    # path existence, type and stat are checked by one request
+    sftp_client_mock.stat.assert_called_once_with("/some/file.txt")
+
+
+def test_sftp_connection_resolve_dir(sftp_client_mock):
+    from onetl.connection import SFTP
+    from onetl.impl import RemotePath
+
+    conn = SFTP(host="some_host")
+    assert conn.path_exists("/some/dir")
+    assert conn.is_dir("/some/dir")
+
+    sftp_client_mock.stat.reset_mock()
+    remote_dir = conn.resolve_dir("/some/dir")
+    assert remote_dir == RemotePath("/some/dir")
+    sftp_client_mock.stat.assert_called_once_with("/some/dir")
+
+
+def test_sftp_connection_resolve_missing_path(sftp_client_mock):
+    from onetl.connection import SFTP
+    from onetl.exception import DirectoryNotFoundError
+
+    conn = SFTP(host="some_host")
+    assert not conn.path_exists("/missing")
+
+    with pytest.raises(FileNotFoundError, match="File '/missing' does not exist"):
+        conn.resolve_file("/missing")
+
+    with pytest.raises(DirectoryNotFoundError, match="Directory '/missing' does not exist"):
+        conn.resolve_dir("/missing")
+
+
+def test_sftp_connection_resolve_wrong_type(sftp_client_mock):
+    from onetl.connection import SFTP
+    from onetl.exception import NotAFileError
+
+    conn = SFTP(host="some_host")
+    assert not conn.is_file("/some/dir")
+    assert not conn.is_dir("/some/file.txt")
+
+    with pytest.raises(NotAFileError, match="'/some/dir' .* is not a file"):
+        conn.resolve_file("/some/dir")
+
+    with pytest.raises(NotADirectoryError, match="'/some/file.txt' .* is not a directory"):
+        conn.resolve_dir("/some/file.txt")
+
+
+def test_sftp_connection_rename_falls_back_if_posix_rename_is_not_supported(sftp_client_mock):
+    from onetl.connection import SFTP
+    from onetl.impl import RemotePath
+
+    sftp_client_mock.posix_rename.side_effect = OSError("Operation unsupported")
+
+    conn = SFTP(host="some_host")
+    conn._rename_file(RemotePath("/some/file.txt"), RemotePath("/some/new1.txt"))
+
+    sftp_client_mock.posix_rename.assert_called_once_with("/some/file.txt", "/some/new1.txt")
+    sftp_client_mock.rename.assert_called_once_with("/some/file.txt", "/some/new1.txt")
+    assert conn._posix_rename_supported is False
+
+    # server does not support posix rename, do not even try
+    conn._rename_file(RemotePath("/some/new1.txt"), RemotePath("/some/new2.txt"))
+
+    sftp_client_mock.posix_rename.assert_called_once()
+    assert sftp_client_mock.rename.call_args_list == [
+        call("/some/file.txt", "/some/new1.txt"),
+        call("/some/new1.txt", "/some/new2.txt"),
+    ]
+
+
+def test_sftp_connection_rename_uses_posix_rename_if_supported(sftp_client_mock):
+    from onetl.connection import SFTP
+    from onetl.impl import RemotePath
+
+    conn = SFTP(host="some_host")
+    conn._rename_file(RemotePath("/some/file.txt"), RemotePath("/some/new1.txt"))
+    conn._rename_file(RemotePath("/some/new1.txt"), RemotePath("/some/new2.txt"))
+
+    assert sftp_client_mock.posix_rename.call_count == 2
+    sftp_client_mock.rename.assert_not_called()
+    assert conn._posix_rename_supported is True